@@ -1,12 +1,26 @@
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import time
+import uuid
+
 import uvicorn
+from cachetools import LRUCache
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
+from starlette.datastructures import Headers
 from fastapi.staticfiles import StaticFiles
+from starlette.staticfiles import NotModifiedResponse
 from fastapi.templating import Jinja2Templates
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
+import anyio.to_thread
+import numpy as np
+from redis import asyncio as aioredis
 from PIL import Image
 from io import BytesIO
 import cnn
@@ -83,19 +97,434 @@ app = FastAPI(
     openapi_tags=tags_metadata
 )
 
-limiter = Limiter(key_func=get_remote_address)
+def get_client_ip(request: Request) -> str:
+    """Rate-limit key: the app sits behind Hugging Face Spaces' proxy, so
+    request.client.host is the internal bridge IP shared by everyone. The real client
+    is the first address in X-Forwarded-For when the proxy provides it."""
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return get_remote_address(request)
+
+
+# With several workers, in-process counters would each allow the full quota (so 4 workers
+# = 4x the documented limit per IP). Pointing slowapi at Redis keeps one shared counter;
+# without REDIS_URL set we fall back to the old in-memory behaviour.
+limiter = Limiter(key_func=get_client_ip, storage_uri=os.getenv("REDIS_URL", "memory://"))
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+class EchoResponse(Response):
+    """Pure-ASGI echo for the "dumb mirror": request body chunks are forwarded from the
+    receive channel straight to the send channel, so memory stays at one chunk however
+    large the upload. (StreamingResponse over request.stream() looks equivalent but its
+    disconnect listener races the body iterator for receive() messages and drops them.)"""
+
+    def __init__(self, media_type):
+        super().__init__(media_type=media_type)
+
+    async def __call__(self, scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": [(b"content-type", self.media_type.encode("latin-1"))]
+        })
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+            if not more_body:
+                break
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that tells browsers to keep our assets: everything under /static only
+    ever changes on a deploy, so responses carry a year-long immutable Cache-Control
+    (plus the ETag starlette already sets). When the client accepts gzip and a
+    pre-compressed sibling exists (foo.css.gz, produced at image build time), that file
+    is served instead with the original's media type - same bytes saved on every hit."""
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        if "gzip" in request_headers.get("accept-encoding", ""):
+            gz_path = f"{full_path}.gz"
+            try:
+                gz_stat = os.stat(gz_path)
+            except OSError:
+                pass
+            else:
+                response = FileResponse(
+                    gz_path,
+                    status_code=status_code,
+                    stat_result=gz_stat,
+                    media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain"
+                )
+                response.headers["content-encoding"] = "gzip"
+                response.headers["vary"] = "Accept-Encoding"
+                response.headers["cache-control"] = self.CACHE_CONTROL
+                # Same revalidation the base class does on the identity path: a client
+                # presenting the right ETag gets a 304 instead of the body again.
+                if self.is_not_modified(response.headers, request_headers):
+                    return NotModifiedResponse(response.headers)
+                return response
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["cache-control"] = self.CACHE_CONTROL
+        return response
+
+
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
 
+# Cross-worker (and cross-pod, if it comes to that) response cache: the in-process LRU
+# below only helps within one worker, while a shared Redis hash of final response bodies
+# lets any worker reuse what another one already computed. Only active when REDIS_URL is
+# configured - same switch as the rate limiter storage.
+REDIS_URL = os.getenv("REDIS_URL")
+_redis = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+RESPONSE_CACHE_TTL = 600  # seconds
+_CACHED_PATHS = ("/predict", "/backup")
+
+# Sliding-window rate limit for the cached endpoints, evaluated in the same Redis
+# round-trip as the cache lookup. The Lua script runs atomically server-side: drop
+# entries older than the window, count what's left, and only record the new hit when
+# under the limit. Returns 1 when the request is allowed.
+_RATE_LIMIT_TIMES = 2
+_RATE_LIMIT_WINDOW = 60  # seconds
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('EXPIRE', key, window)
+    return 1
+end
+return 0
+"""
+
+
+def _limited_by_middleware() -> bool:
+    """slowapi exempt_when hook: with Redis configured, /predict and /backup are
+    rate-limited by the pipelined sliding window in the middleware instead, so the
+    per-route slowapi check would only double-count."""
+    return _redis is not None
+
+
+@app.middleware("http")
+async def redis_response_cache(request: Request, call_next):
+    """Serve /predict and /backup straight from Redis when the exact same body was
+    answered recently, keyed by SHA-256 of the raw upload, and enforce the 2/minute
+    sliding window in the same pipelined round-trip. On a miss, the handler runs as
+    usual and its response is stored for RESPONSE_CACHE_TTL. Redis being down just
+    means cache misses and no limiting - never errors."""
+    if _redis is None or request.method != "POST" or request.url.path not in _CACHED_PATHS:
+        return await call_next(request)
+
+    # Don't buffer an upload the handler is going to refuse anyway: the capped reader
+    # drops the stream the moment it passes the 5 MB limit - whether announced up front
+    # or trickled in without a Content-Length - so nothing oversized ever sits fully in
+    # RAM here either.
+    try:
+        body = bytes(await _read_body(request))
+    except UploadTooLarge:
+        return _too_large_response()
+    # _read_body consumed request.stream(), which BaseHTTPMiddleware replays downstream
+    # as an *empty* body; caching the bytes where body() would have put them makes the
+    # middleware hand the handler the real payload again.
+    request._body = body
+    cache_key = f"wakee:{request.url.path}:{hashlib.sha256(body).hexdigest()}"
+    limit_key = f"wakee:rl:{request.url.path}:{get_client_ip(request)}"
+    now = time.time()
+    try:
+        async with _redis.pipeline(transaction=False) as pipe:
+            pipe.eval(
+                _SLIDING_WINDOW_LUA, 1, limit_key,
+                now, _RATE_LIMIT_WINDOW, _RATE_LIMIT_TIMES, f"{now}:{uuid.uuid4().hex}"
+            )
+            pipe.get(cache_key)
+            allowed, cached = await pipe.execute()
+    except Exception:
+        allowed, cached = 1, None
+    if not allowed:
+        # Same shape as slowapi's _rate_limit_exceeded_handler, so clients see one format.
+        return JSONResponse(
+            {"error": f"Rate limit exceeded: {_RATE_LIMIT_TIMES} per 1 minute"},
+            status_code=429
+        )
+    if cached is not None:
+        return HTMLResponse(cached)
+
+    response = await call_next(request)
+    chunks = [chunk async for chunk in response.body_iterator]
+    resp_body = b"".join(chunks)
+    # The handlers report failures as 200s with an "Error ..." text; neither those nor
+    # real error statuses are worth remembering for ten minutes.
+    if response.status_code == 200 and not resp_body.startswith(b"Error"):
+        try:
+            await _redis.set(cache_key, resp_body, ex=RESPONSE_CACHE_TTL)
+        except Exception:
+            pass
+    return Response(
+        content=resp_body,
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        media_type=response.media_type
+    )
+
+
+@app.on_event("startup")
+async def raise_threadpool_limit():
+    """Starlette's default threadpool caps at 40 tokens shared across everything it
+    offloads; raise it so our CPU-bound decode offloading does not starve StaticFiles
+    and the rest of what shares the limiter."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+
+
+# Running the CNN is by far the most expensive part of /predict and /backup, so identical
+# bodies (same hash) should only pay for the PIL decode + inference once - we run on free
+# resources after all! The cache keeps the 4 raw CNN floats, thresholding stays per-endpoint.
+# _cnn_inflight holds one future per body currently being computed (single-flight):
+# concurrent duplicates await that future instead of redoing the work, and once it
+# resolves the result lives on in the LRU.
+_cnn_cache = LRUCache(maxsize=256)
+_cnn_inflight = {}
+
+
+# Hard cap on uploads: a webcam frame fits many times over, and anything bigger would
+# only risk an out-of-memory on our free-tier resources.
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised by _read_body the moment a stream passes MAX_BODY_BYTES, so an oversized
+    (or chunked, unannounced) upload is dropped mid-read instead of filling RAM first."""
+
+
+def _too_large_response() -> Response:
+    return Response(
+        "That image is too large for us - please keep uploads under 5 MB!",
+        status_code=413, media_type="text/plain"
+    )
+
+
+async def _read_body(request: Request) -> bytearray:
+    """Stream the upload into a single buffer pre-sized from Content-Length, instead of
+    request.body()'s accumulate-chunks-then-join which briefly holds two full copies of
+    the image in RAM. Chunks beyond the announced length (or when the header is absent)
+    are collected separately and appended at the end, so a lying client still works -
+    but only up to MAX_BODY_BYTES: past that the read aborts with UploadTooLarge."""
+    try:
+        expected = int(request.headers.get("content-length", 0))
+    except ValueError:
+        expected = 0
+    if expected > MAX_BODY_BYTES:
+        raise UploadTooLarge
+    buf = bytearray(expected)
+    view = memoryview(buf)
+    pos = 0
+    extra = []
+    extra_len = 0
+    async for chunk in request.stream():
+        if extra or pos + len(chunk) > expected:
+            extra.append(bytes(chunk))
+            extra_len += len(chunk)
+        else:
+            view[pos:pos + len(chunk)] = chunk
+            pos += len(chunk)
+        if pos + extra_len > MAX_BODY_BYTES:
+            view.release()
+            raise UploadTooLarge
+    view.release()
+    if pos < expected:
+        del buf[pos:]
+    if extra:
+        buf.extend(b"".join(extra))
+    return buf
+
+
+def _looks_like_image(body) -> bool:
+    """Magic-byte sniff of the formats PIL can actually decode here (JPEG, PNG, WEBP,
+    GIF, BMP), so obvious non-images are turned away before any decoding work."""
+    head = bytes(body[:12])
+    if head.startswith((b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF8", b"BM")):
+        return True
+    return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+
+
+async def _read_checked_image(request: Request):
+    """Read the upload with the cheap rejections done first: a wrong Content-Type or an
+    oversized Content-Length never reaches the body read, and a body that does not start
+    like a decodable image never reaches PIL. Returns the body, or the 4xx Response to
+    send straight back."""
+    if not request.headers.get("content-type", "").startswith("image/"):
+        return Response(
+            "Please send an image, with a matching Content-Type header (such as image/jpeg)! The /test endpoint can show you what the API receives.",
+            status_code=415, media_type="text/plain"
+        )
+    try:
+        body = await _read_body(request)
+    except UploadTooLarge:
+        return _too_large_response()
+    if not _looks_like_image(body):
+        return Response(
+            "This does not look like an image we can decode (JPEG, PNG, WEBP, GIF or BMP)! The /test endpoint can show you what the API receives.",
+            status_code=415, media_type="text/plain"
+        )
+    return body
+
+
+def _decode_sync(body: bytes) -> Image.Image:
+    """Blocking PIL decode, kept synchronous on purpose so it can be pushed onto a
+    worker thread and off the event loop. The buffer is closed as soon as the decode is
+    done rather than waiting on the GC, which keeps peak memory down when several
+    predictions overlap; callers are responsible for closing the returned image."""
+    with BytesIO(body) as buf, Image.open(buf) as im:
+        # For JPEGs, draft() lets the decoder downscale by 1/2, 1/4 or 1/8 during the
+        # decode itself (near-free). We aim for the 256px the CNN preprocessor resizes
+        # to anyway - draft never undershoots, so the model input stays identical.
+        # A no-op for formats without draft support.
+        im.draft("RGB", (256, 256))
+        return im.convert("RGB")
+
+
+# Micro-batching of concurrent CNN calls: with several predictions in flight, one model
+# run over a stacked batch is cheaper than one run per image. Callers enqueue their
+# decoded image with a future; a background task drains the queue (up to MAX_BATCH
+# images, waiting at most MAX_WAIT for stragglers) and resolves every future from a
+# single cnn.get_emotions call. A lone request only ever waits MAX_WAIT at worst.
+MAX_BATCH = 8
+MAX_WAIT = 0.01  # seconds
+
+_batch_queue: asyncio.Queue = asyncio.Queue()
+
+
+async def _cnn_batch_worker():
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _batch_queue.get()]
+        deadline = loop.time() + MAX_WAIT
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_batch_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        try:
+            preds = await asyncio.to_thread(cnn.get_emotions, [im for im, _ in batch])
+        except Exception as exc:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            continue
+        # Each caller gets its row of the raw output as-is: boxing the four floats into
+        # a Python list only to compare them again was wasted work, and classify_drift
+        # consumes the ndarray directly.
+        for (_, fut), pred in zip(batch, preds):
+            if not fut.done():
+                fut.set_result(pred)
+
+
+@app.on_event("startup")
+async def start_batch_worker():
+    app.state.cnn_batch_task = asyncio.create_task(_cnn_batch_worker())
+
+
+# Drift decision on the raw CNN output, in one vectorized comparison instead of the old
+# dict + four-branch ladder. Labels are in priority order (disengagement first, per the
+# focus on ADHD); the CNN emits [boredom, confusion, engagement, frustration], hence the
+# reindexing. Engagement triggers on "less than", so its sign is flipped on both sides.
+DRIFT_LABELS = ("disengagement", "frustration", "confusion", "boredom")
+_DRIFT_ORDER = np.array([2, 3, 1, 0])
+_DRIFT_THRESH = np.array([2.5, 0.5, 0.61, 1.05])
+_DRIFT_SIGN = np.array([-1.0, 1.0, 1.0, 1.0])
+
+
+# Fixed replies, pre-encoded once: no reason to re-encode the same few strings (and
+# re-derive response headers from them) on every request.
+BACKUP_MESSAGES = {
+    "disengagement": b"Disengagement: careful, you're losing focus!",
+    "frustration": b"Frustration: maybe it's time for a pause?",
+    "confusion": b"Confusion: ask someone else's opinion on what you do not understand?",
+    "boredom": b"Boredom: a short walk to get back into things!"
+}
+NO_DRIFT_PREDICT = b"Good news, no cognitive drift recognized!"
+NO_DRIFT_BACKUP = b"Good news: no cognitive drift recognized!"
+
+
+def classify_drift(cnn_predict):
+    """Match the 4 CNN floats to a drift label, or None when no drifting markers are
+    identified. Shared by /predict and /backup so the thresholds live in one place."""
+    pred = np.asarray(cnn_predict)[_DRIFT_ORDER]
+    triggered = (_DRIFT_SIGN * pred) > (_DRIFT_SIGN * _DRIFT_THRESH)
+    if not triggered.any():
+        return None
+    return DRIFT_LABELS[int(np.argmax(triggered))]
+
+
+async def _run_cnn(body: bytes) -> np.ndarray:
+    """Shared CNN runner behind /predict and /backup. Memoizes the 4-float CNN output
+    under the SHA-256 of the raw body, so a repeated image skips decode and inference
+    entirely. Concurrent requests for the same body are single-flighted: the first one
+    computes and publishes its result on a future, the duplicates just await it."""
+    key = hashlib.sha256(body).digest()
+    cached = _cnn_cache.get(key)
+    if cached is not None:
+        return cached
+    inflight = _cnn_inflight.get(key)
+    if inflight is not None:
+        # shield: a duplicate request being cancelled must not tear down the leader's
+        # result while others still wait on it.
+        return await asyncio.shield(inflight)
+    fut = asyncio.get_running_loop().create_future()
+    _cnn_inflight[key] = fut
+    try:
+        # The decode is CPU-bound and synchronous: running it in a worker thread lets
+        # uvicorn keep serving the other endpoints in the meantime. Inference itself
+        # goes through the micro-batching queue.
+        pilimage = await asyncio.to_thread(_decode_sync, body)
+        try:
+            batch_fut = asyncio.get_running_loop().create_future()
+            await _batch_queue.put((pilimage, batch_fut))
+            cnn_predict = await batch_fut
+        finally:
+            pilimage.close()
+        _cnn_cache[key] = cnn_predict
+        fut.set_result(cnn_predict)
+        return cnn_predict
+    except BaseException as exc:
+        if not fut.done():
+            fut.set_exception(exc)
+            fut.exception()  # waiters still get the raise; this just quiets the
+                             # "exception never retrieved" warning when there are none
+        raise
+    finally:
+        _cnn_inflight.pop(key, None)
+
+
+# The front page is fully static (the only context is the request itself, used for
+# url_for), so there is no reason to run Jinja on every GET /.
+_index_html = None
+
+
 @app.get("/", tags=["Root"], response_class=HTMLResponse)
 async def read_root(request: Request):
-    """Core website display."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    """Core website display. Rendered once per worker on the first visit - which keeps
+    url_for pointed at whatever host actually serves us - then replayed as plain bytes."""
+    global _index_html
+    if _index_html is None:
+        _index_html = templates.TemplateResponse(request, "index.html").body
+    return HTMLResponse(_index_html)
 
 
 @app.post("/test", tags=["Test"], response_class=HTMLResponse)
@@ -114,15 +543,14 @@ async def check_request(request: Request):
     
     **Windows**
     ```curl.exe -X POST https://mevelios-wakee-reloaded-api.hf.space/test -H "Content-Type: image/jpeg" --data-binary "@frame175751278672.jpg" --output "wakee_testing.jpg"```"""
-    body = await request.body()
-    return Response(
-        content=body,
-        media_type=request.headers.get("content-type", "application/octet-stream")
-    )
+    # A mirror should never materialize what it reflects: chunks are forwarded from the
+    # ASGI receive stream straight into the response, so memory stays at one chunk no
+    # matter how big the upload is.
+    return EchoResponse(request.headers.get("content-type", "application/octet-stream"))
 
 
 @app.post("/predict", tags=["Predict"], response_class=HTMLResponse)
-@limiter.limit("2/minute")
+@limiter.limit("2/minute", exempt_when=_limited_by_middleware)
 async def analyze_drift(request: Request):
     """Function communicating both ways with our CNN, matching WAKEE's core function. From the received image:
     * Captured frame (recovered from the request) is sent as CNN input,\n
@@ -131,55 +559,47 @@ async def analyze_drift(request: Request):
     * Before sollicitating our LLM to generate a supportive message if markers of cognitive drift are identified.\n
     Given the focus on ADHD, very low engagement (or "disengagement") is given priority in recognition.\n
     Amongst the other three, only the top representative is kept. All other cases mean no drifting markers were identified!"""
-    body = await request.body()
+    body = await _read_checked_image(request)
+    if isinstance(body, Response):
+        return body
     try:
-        pilimage = Image.open(BytesIO(body)).convert("RGB")
-        cnn_predict = (cnn.get_emotion(pilimage))[0].tolist()
-        dict_cnn = {"boredom" : cnn_predict[0], "confusion" : cnn_predict[1], "engagement" : cnn_predict[2], "frustration" : cnn_predict[3]}
-        cnn_engagement = dict_cnn["engagement"]
-        cnn_boredom = dict_cnn["boredom"]
-        cnn_confusion = dict_cnn["confusion"]
-        cnn_frustration = dict_cnn["frustration"]
-
-        if cnn_engagement < 2.5:
-            return llm.get_recommendation("disengagement")
-        elif cnn_frustration > 0.5:
-            return llm.get_recommendation("frustration")
-        elif cnn_confusion > 0.61:
-            return llm.get_recommendation("confusion")
-        elif cnn_boredom > 1.05:
-            return llm.get_recommendation("boredom")
-        else:
-            return "Good news, no cognitive drift recognized!"
+        cnn_predict = await _run_cnn(body)
+        drift = classify_drift(cnn_predict)
+        if drift is not None:
+            return llm.get_recommendation(drift)
+        return Response(NO_DRIFT_PREDICT, media_type="text/html")
     except Exception as exc:
         return f"Error in the process! Please use /backup endpoint for now. Displaying error message:\n{exc}"
 
 @app.post("/backup", tags=["Backup"], response_class=HTMLResponse)
-@limiter.limit("2/minute")
+@limiter.limit("2/minute", exempt_when=_limited_by_middleware)
 async def backup_analysis(request: Request):
     """Similar function to the /predict endpoint, minus the recommendation generator - instead, you will receive the identified emotion and a short, unvarying message."""
-    body = await request.body()
+    body = await _read_checked_image(request)
+    if isinstance(body, Response):
+        return body
     try:
-        pilimage = Image.open(BytesIO(body)).convert("RGB")
-        cnn_predict = (cnn.get_emotion(pilimage))[0].tolist()
-        dict_cnn = {"boredom" : cnn_predict[0], "confusion" : cnn_predict[1], "engagement" : cnn_predict[2], "frustration" : cnn_predict[3]}
-        cnn_engagement = dict_cnn["engagement"]
-        cnn_boredom = dict_cnn["boredom"]
-        cnn_confusion = dict_cnn["confusion"]
-        cnn_frustration = dict_cnn["frustration"]
-
-        if cnn_engagement < 2.5:
-            return "Disengagement: careful, you're losing focus!"
-        elif cnn_frustration > 0.5:
-            return "Frustration: maybe it's time for a pause?"
-        elif cnn_confusion > 0.61:
-            return "Confusion: ask someone else's opinion on what you do not understand?"
-        elif cnn_boredom > 1.05:
-            return "Boredom: a short walk to get back into things!"
-        else:
-            return "Good news: no cognitive drift recognized!"
+        cnn_predict = await _run_cnn(body)
+        drift = classify_drift(cnn_predict)
+        if drift is not None:
+            return Response(BACKUP_MESSAGES[drift], media_type="text/html")
+        return Response(NO_DRIFT_BACKUP, media_type="text/html")
     except Exception as exc:
         return exc
 
 if __name__=="__main__":
-    uvicorn.run(app, host="0.0.0.0", port=7860) 
\ No newline at end of file
+    # Formatting and writing a log line per request is measurable overhead on the hot
+    # path and tells us nothing we need: keep uvicorn quiet beyond warnings and skip
+    # its dictConfig entirely.
+    logging.getLogger("uvicorn").handlers = [logging.NullHandler()]
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=7860,
+        workers=int(os.getenv("UVICORN_WORKERS", "4")),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_config=None,
+        log_level="warning"
+    ) 
\ No newline at end of file
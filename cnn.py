@@ -1,3 +1,4 @@
+import numpy as np
 import onnxruntime as ort
 import torchvision.transforms.v2 as transforms
 import os
@@ -5,18 +6,64 @@ import os
 # Global variable to store the session
 _session = None
 
+_MODEL_FP32 = "model/daisee_model.onnx"
+_MODEL_INT8 = "model/daisee_model_int8.onnx"
+
+def _quantized_model_path():
+    """Return the path of the INT8 model, producing it from the FP32 one on first call.
+
+    Dynamic quantization shrinks the weights to 8-bit integers, which roughly halves
+    inference time on CPU (int8 dot products) with a negligible accuracy cost. If
+    quantization fails for any reason we simply keep using the FP32 model.
+    """
+    if os.path.exists(_MODEL_INT8):
+        return _MODEL_INT8
+    # Normally the Dockerfile has produced the INT8 file at image build time; this is
+    # only a fallback for environments that skipped that step. Several workers may get
+    # here at once, so each quantizes into its own temp file and publishes it with an
+    # atomic os.replace - a sibling either sees no file or a complete one, never a
+    # truncated write.
+    tmp_path = f"{_MODEL_INT8}.{os.getpid()}.tmp"
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        quantize_dynamic(_MODEL_FP32, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, _MODEL_INT8)
+        return _MODEL_INT8
+    except Exception as e:
+        print(f"⚠️ INT8 quantization unavailable ({e}), falling back to FP32 model")
+        return _MODEL_FP32
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 def _load_model():
-    """Load the ONNX model"""
+    """Load the ONNX model (INT8-quantized when possible)"""
     global _session
     if _session is None:
         try:
-            _session = ort.InferenceSession("model/daisee_model.onnx")
+            opts = ort.SessionOptions()
+            opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            opts.intra_op_num_threads = os.cpu_count() or 1
+            _session = ort.InferenceSession(
+                _quantized_model_path(),
+                sess_options=opts,
+                providers=["CPUExecutionProvider"]
+            )
             # print("✅ Modèle ONNX chargé avec succès")
         except Exception as e:
             print(f"❌ Error loading the model: {e}, \npwd path: {os.getcwd()}")
             raise
     return _session
 
+# Image transformations required by the model, built once for every inference
+_transform = transforms.Compose([
+    transforms.Resize(256),
+    transforms.CenterCrop(224),
+    transforms.ToTensor(),
+    transforms.Normalize([0.485, 0.456, 0.406],
+                        [0.229, 0.224, 0.225])
+])
+
 def get_emotion(pil_image):
     """
     Infers the emotional state from a given PIL image using a pre-trained ONNX model.
@@ -32,6 +79,21 @@ def get_emotion(pil_image):
         numpy.ndarray: The raw prediction outputs from the ONNX model,
                        typically representing probabilities or logits for different emotion classes.
     """
+    return get_emotions([pil_image])
+
+def get_emotions(pil_images):
+    """
+    Batched variant of get_emotion: runs one inference over several PIL images at once.
+
+    Batching shares the per-call session overhead across all images, which is cheaper
+    than one model run per image when requests arrive concurrently.
+
+    Args:
+        pil_images (list[PIL.Image.Image]): The input images in PIL format.
+
+    Returns:
+        numpy.ndarray: One row of raw predictions per input image, shape (len(pil_images), 4).
+    """
 
     # # Charger le modèle ONNX
     # session = ort.InferenceSession("daisee_model.onnx")
@@ -39,21 +101,27 @@ def get_emotion(pil_image):
      # loading model (lazy loading)
     session = _load_model()
 
-    # Define the image transformations required by the model
-    transform = transforms.Compose([
-        transforms.Resize(256),
-        transforms.CenterCrop(224),
-        transforms.ToTensor(),
-        transforms.Normalize([0.485, 0.456, 0.406], 
-                            [0.229, 0.224, 0.225])
-    ])
-    # Apply transformations, add a batch dimension, and convert to a NumPy array
-    input_tensor = transform(pil_image).unsqueeze(0).numpy()  # (1, 3, 224, 224)
+    # Apply transformations to every image and stack into one batch
+    input_tensor = np.stack([_transform(im).numpy() for im in pil_images])  # (B, 3, 224, 224)
 
     # Run the inference on the ONNX model
     # 'output' is the name of the output tensor, 'input' is the name of the input tensor
     outputs = session.run(['output'], {'input': input_tensor})
     preds = outputs[0] # Extract the actual predictions from the output list
-    
 
-    return preds
\ No newline at end of file
+
+    return preds
+
+
+def _warmup():
+    """Run one dummy inference so the first real request hits warm caches instead of
+    paying for lazy initialization inside the runtime."""
+    dummy = np.zeros((1, 3, 224, 224), dtype=np.float32)
+    _session.run(['output'], {'input': dummy})
+
+
+# Create the session once at import - every process has it resident before serving its
+# first request - and warm it up. ONNX Runtime sessions are thread-safe, so concurrent
+# get_emotion calls can share this single instance without locking.
+_load_model()
+_warmup()
\ No newline at end of file
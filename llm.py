@@ -1,3 +1,4 @@
+from cachetools import TTLCache, cached
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_mistralai import ChatMistralAI
@@ -48,8 +49,16 @@ def match_emotion_response(emotion):
     
 
 
+# There are only four possible emotions, yet every /predict call used to hit the remote
+# LLM - which has usage limits of its own. Caching the generated message per emotion for
+# a few minutes keeps us well under those limits; the TTL (rather than caching forever)
+# preserves the variety the system templates are there for.
+_recommendation_cache = TTLCache(maxsize=16, ttl=300)
+
+
+@cached(_recommendation_cache)
 def get_recommendation(emotion):
-    
+
     system_template = random.choice(system_templates)
     prompt_template = ChatPromptTemplate.from_messages([
         ('system', system_template),